@@ -27,82 +27,373 @@
 import tkinter as tk
 from tkinter import ttk
 from tkinter import messagebox
+import tkinter.font as tkfont
 from tkinter.simpledialog import askstring  # added import for askstring
 from subprocess import check_output, STDOUT, CalledProcessError
+from concurrent.futures import ThreadPoolExecutor
+from http.client import HTTPConnection
+from threading import Lock
 import json
-from json import JSONDecodeError
-from os import _exit, path, makedirs, environ
+import re
+from os import path, makedirs, environ, replace
+from shutil import which
 from webbrowser import open_new_tab
 import sys
 from datetime import datetime
+from itertools import islice
+from time import monotonic
 import ctypes
 
+# orjson parses the large peers/listnetworks payloads several times
+# faster than the stdlib; both accept the raw bytes from check_output.
+# The implementation is picked once at import so the hot parse path
+# carries no availability branch.
+try:
+    import orjson as _fast_json
+
+    _json_loads = _fast_json.loads
+    _json_dumps = _fast_json.dumps
+except ImportError:
+    _json_loads = json.loads
+
+    def _json_dumps(obj):
+        return json.dumps(obj).encode()
+
 # Constants for UI colors and paths
 BACKGROUND = "#d9d9d9"  # Default background color
 FOREGROUND = "black"  # Default text color
 BUTTON_BACKGROUND = "#ffb253"  # Button background color
 BUTTON_ACTIVE_BACKGROUND = "#ffbf71"  # Button active background color
 
+# Shared option set for plain monospace labels; splatted into the
+# constructors so the common styling lives in one place
+LABEL_OPTS = {"font": "Monospace", "bg": BACKGROUND, "fg": FOREGROUND}
+
 # Directory and file for storing network history
 HISTORY_FILE_DIRECTORY = path.join(environ["APPDATA"], "zerotier-gui")
 HISTORY_FILE_NAME = "network_history.json"
+HISTORY_FILE_PATH = path.join(HISTORY_FILE_DIRECTORY, HISTORY_FILE_NAME)
+
+# Resolved zerotier-cli path cached between launches, so warm starts
+# skip both the PATH search and the version probe
+ZT_CLI_CACHE_FILE = path.join(HISTORY_FILE_DIRECTORY, "zt_cli_path.txt")
 
 # Paths for ZeroTier configuration on Windows
 ZEROTIER_DIR = path.join(environ["ProgramData"], "ZeroTier", "One")
 ZEROTIER_AUTH_TOKEN = path.join(ZEROTIER_DIR, "authtoken.secret")
 
+# Keep spawned console programs from flashing a window
+CREATE_NO_WINDOW = 0x08000000
+
+# Precompiled label formatters; binding .format once skips re-parsing
+# the format spec on every update
+_SIDEBAR_FMT = "{:<20}{}".format
+_INFO_FMT = "{:22s}{}".format
+
+# Resolved once at import; ctypes.windll re-resolves the DLL handle on
+# every attribute chain otherwise
+_shell32 = ctypes.windll.shell32
+
+# One row of `netsh interface show interface` output, compiled once at
+# import instead of on every state query
+_NETSH_IFACE_RE = re.compile(
+    r"^(?P<admin>\S+)\s+(?P<state>\S+)\s+(?P<type>\S+)\s+(?P<name>.+)$"
+)
+
 
 class MainWindow:
-    # Configures a Treeview widget with specified columns, widths, and headings
+    # Configures a Treeview widget with specified columns, widths, and
+    # headings. stretch=False keeps Tk from recomputing column geometry
+    # on every subsequent insert.
     def _configure_treeview(self, tree, columns, widths, headings):
         tree["show"] = "headings"
+        tree["columns"] = tuple(columns)
         for col, width, heading in zip(columns, widths, headings):
-            tree.column(col, width=width)
+            tree.column(
+                col, width=width, minwidth=width, stretch=False, anchor="w"
+            )
             tree.heading(col, text=heading)
 
-    # Executes a shell command and returns its output
-    def _execute_command(self, command: str) -> str:
+    # Reconciles a Treeview against new_rows ({iid: (values, tags)}):
+    # rows are detached during the update so Tk lays out once, then only
+    # changed rows are rewritten, new rows inserted and gone rows deleted
+    def _diff_treeview(self, tree, new_rows):
+        existing = set(tree.get_children())
+        if existing:
+            tree.detach(*existing)
+        for iid in existing - new_rows.keys():
+            tree.delete(iid)
+        for iid, (values, tags) in new_rows.items():
+            if iid in existing:
+                if tuple(map(str, tree.item(iid, "values"))) != tuple(map(str, values)):
+                    tree.item(iid, values=values, tags=tags)
+                else:
+                    tree.item(iid, tags=tags)
+            else:
+                tree.insert("", "end", iid=iid, values=values, tags=tags)
+        for position, iid in enumerate(new_rows):
+            tree.move(iid, "", position)
+
+    # Executes zerotier-cli (as an argv tuple) without the cmd.exe
+    # wrapper and returns its raw output bytes; results may be reused
+    # for up to ttl seconds to avoid re-spawning the same command
+    def _execute_command(self, argv: tuple, ttl: float = 0.0) -> bytes:
+        if ttl > 0:
+            cached = self._cmd_cache.get(argv)
+            if cached is not None and monotonic() - cached[0] < ttl:
+                return cached[1]
         try:
-            output = check_output(["cmd", "/c", command], stderr=STDOUT)
-            return output.decode()
+            output = check_output(
+                (self._zt_cli,) + tuple(argv[1:]),
+                stderr=STDOUT,
+                creationflags=CREATE_NO_WINDOW,
+                close_fds=True,
+            )
+            if ttl > 0:
+                self._cmd_cache[argv] = (monotonic(), output)
+            return output
         except CalledProcessError as e:
-            messagebox.showerror("Error", f"Error while executing the command:\n{e.output.decode()}")
-            return ""
+            # May run on a worker thread, so route the dialog through the
+            # Tk event loop instead of touching widgets directly
+            self.window.after(
+                0, messagebox.showerror, "Error",
+                f"Error while executing the command:\n{e.output.decode()}"
+            )
+            return b""
+
+    # Executes a command whose output is JSON and caches the parsed
+    # result so repeated calls within the same interaction skip both the
+    # subprocess and the re-parse
+    def _execute_json_command(self, argv: tuple, ttl: float = 0.0):
+        if ttl > 0:
+            cached = self._json_cache.get(argv)
+            if cached is not None and monotonic() - cached[0] < ttl:
+                return cached[1]
+        data = self._execute_command(argv, ttl=ttl)
+        parsed = _json_loads(data) if data else {}
+        if ttl > 0:
+            self._json_cache[argv] = (monotonic(), parsed)
+        return parsed
+
+    # Fetches a resource from the service's local HTTP API, which
+    # answers in about a millisecond where zerotier-cli costs a whole
+    # process launch. Returns None when the service or the auth token
+    # is unavailable so callers can fall back to the CLI.
+    def _zt_get(self, api_path, ttl=0.0):
+        if ttl > 0:
+            cached = self._json_cache.get(api_path)
+            if cached is not None and monotonic() - cached[0] < ttl:
+                return cached[1]
+        if self._auth is None:
+            try:
+                with open(ZEROTIER_AUTH_TOKEN) as f:
+                    self._auth = f.read().strip()
+            except OSError:
+                return None
+        with self._api_lock:
+            try:
+                if self._api_conn is None:
+                    self._api_conn = HTTPConnection(
+                        "127.0.0.1", 9993, timeout=2
+                    )
+                self._api_conn.request(
+                    "GET", api_path, headers={"X-ZT1-Auth": self._auth}
+                )
+                response = self._api_conn.getresponse()
+                body = response.read()
+                if response.status != 200:
+                    return None
+                parsed = _json_loads(body)
+            except (OSError, ValueError):
+                # Drop the socket; the next call reconnects
+                if self._api_conn is not None:
+                    self._api_conn.close()
+                    self._api_conn = None
+                return None
+        if ttl > 0:
+            self._json_cache[api_path] = (monotonic(), parsed)
+        return parsed
+
+    # Drops cached command output after user-initiated state changes
+    def _invalidate_cache(self):
+        self._cmd_cache.clear()
+        self._json_cache.clear()
+
+    # Runs work on the subprocess pool and hands the finished future to
+    # on_done on the Tk main thread, keeping the UI responsive
+    def _submit(self, work, on_done):
+        future = self._pool.submit(work)
+        future.add_done_callback(
+            lambda fut: self.window.after(0, on_done, fut)
+        )
 
-    # Checks if the current user has administrator privileges
+    # Like _submit, but deduplicated by key: while an identical request
+    # is still in flight, later callers subscribe to its future instead
+    # of spawning another subprocess (mashing Refresh costs one fetch)
+    def _submit_shared(self, key, work, on_done):
+        with self._inflight_lock:
+            future = self._inflight.get(key)
+            submitted = future is None
+            if submitted:
+                future = self._pool.submit(work)
+                self._inflight[key] = future
+
+        if submitted:
+            # registered outside the lock: a future that is already done
+            # runs its callback inline on this thread, which would
+            # deadlock re-acquiring the non-reentrant lock
+            def clear_inflight(fut, key=key):
+                with self._inflight_lock:
+                    if self._inflight.get(key) is fut:
+                        del self._inflight[key]
+
+            future.add_done_callback(clear_inflight)
+        future.add_done_callback(
+            lambda fut: self.window.after(0, on_done, fut)
+        )
+
+    # Checks if the current user has administrator privileges; the
+    # answer can't change for the process lifetime, so the Win32 call is
+    # made once and memoized
     def _is_admin(self):
+        if self._admin is None:
+            try:
+                self._admin = bool(_shell32.IsUserAnAdmin())
+            except (AttributeError, OSError):
+                self._admin = False
+        return self._admin
+
+    # Derives the Windows interface name straight from a network dict,
+    # so per-row callers never re-query the network list
+    @staticmethod
+    def _interface_name_from_net(net):
         try:
-            return ctypes.windll.shell32.IsUserAnAdmin()
-        except:
-            return False
+            return f"ZeroTier One [{net['id']}]"
+        except KeyError:
+            return None
 
     # Retrieves the interface name for a given network index
     def get_interface_name(self, index):
         networks = self.get_networks_info()
         try:
-            network_id = networks[index]["id"]
-            return f"ZeroTier One [{network_id}]"
-        except (IndexError, KeyError):
+            return self._interface_name_from_net(networks[index])
+        except IndexError:
             return None
 
-    # Verifies if ZeroTier is installed and accessible
+    # Verifies if ZeroTier is installed and resolves its absolute path
+    # once so later calls skip the PATH search. The resolved path is
+    # remembered in the history directory; as long as it still exists on
+    # disk, warm starts skip the version-probe subprocess entirely.
     def check_zerotier_installed(self):
-        import subprocess
         try:
-            output = subprocess.check_output(["zerotier-cli", "-v"], stderr=subprocess.STDOUT)
+            with open(ZT_CLI_CACHE_FILE) as f:
+                cached = f.read().strip()
+        except OSError:
+            cached = ""
+        if cached and path.isfile(cached):
+            self._zt_cli = cached
+            return
+
+        self._zt_cli = (
+            which("zerotier-cli.bat")
+            or which("zerotier-cli")
+            or "zerotier-cli"
+        )
+        try:
+            check_output([self._zt_cli, "-v"], stderr=STDOUT, creationflags=CREATE_NO_WINDOW)
         except (CalledProcessError, FileNotFoundError):
             messagebox.showerror("Error", "ZeroTier is not installed or not found.\nEnsure that ZeroTier is installed and available in PATH.")
             sys.exit(1)
+        if path.isabs(self._zt_cli):
+            try:
+                makedirs(HISTORY_FILE_DIRECTORY, exist_ok=True)
+                with open(ZT_CLI_CACHE_FILE, "w") as f:
+                    f.write(self._zt_cli)
+            except OSError:
+                pass  # cache is an optimization only; next start re-probes
 
     # Initializes the main application window and its components
     def __init__(self):
+        # Short-lived caches for zerotier-cli output (raw and parsed)
+        self._cmd_cache = {}
+        self._json_cache = {}
+
+        # Local-service HTTP API state: cached auth token plus one
+        # persistent connection guarded for the worker threads
+        self._auth = None
+        self._api_conn = None
+        self._api_lock = Lock()
+
+        # Joined-network lookup, rebuilt on every refresh_networks; also
+        # answers name and membership queries in O(1)
+        self._networks_by_id = {}
+
+        # Reusable Network Info window, built lazily on first open
+        self._info_window = None
+        self._info_text = None
+
+        # Pending after() handle for the coalesced network refresh
+        self._refresh_pending = None
+
+        # Memoized admin-rights answer, filled on first use
+        self._admin = None
+
+        # In-flight fetches keyed by request, for _submit_shared
+        self._inflight = {}
+        self._inflight_lock = Lock()
+
+        # Reusable peers window, same withdraw/deiconify pattern
+        self._peers_window = None
+        self._peers_refresh = None
+
+        # Worker pool so zerotier-cli calls don't block the event loop
+        self._pool = ThreadPoolExecutor(max_workers=2)
+
+        # Network history is loaded lazily on first access
+        self._network_history = None
+        self._history_dirty = False
+
         self.check_zerotier_installed()  # Ensure ZeroTier is installed
-        self.load_network_history()  # Load network history from file
 
         self.window = self.create_window()  # Create the main application window
         self.window.title("ZeroTier-GUI")
         self.window.resizable(width=False, height=False)
 
+        # One shared Font handle; widgets reference the object instead
+        # of having Tk resolve the "Monospace" name per construction
+        self.mono = tkfont.Font(family="Monospace")
+        LABEL_OPTS["font"] = self.mono
+
+        # One pre-configured button style instead of per-widget colors
+        style = ttk.Style(self.window)
+        style.configure(
+            "Orange.TButton",
+            background=BUTTON_BACKGROUND,
+            foreground=FOREGROUND,
+        )
+        style.map(
+            "Orange.TButton",
+            background=[("active", BUTTON_ACTIVE_BACKGROUND)],
+        )
+        # Fixed row height keeps Treeview layout math constant-time
+        # when rows are batch-inserted
+        style.configure("Treeview", rowheight=20)
+
+        # Shared label styles for the info-style windows; widgets pick
+        # them up by name instead of re-parsing font/color kwargs
+        style.configure(
+            "Info.TLabel",
+            background=BACKGROUND,
+            foreground=FOREGROUND,
+            font=self.mono,
+        )
+        style.configure(
+            "InfoTitle.TLabel",
+            background=BACKGROUND,
+            foreground=FOREGROUND,
+            font=("TkDefaultFont", 18, "bold"),
+        )
+
         # Layout setup: Define frames for organizing UI components
         self.topFrame = tk.Frame(self.window, padx=20, pady=10, bg=BACKGROUND)
         self.topBottomFrame = tk.Frame(self.window, padx=20, bg=BACKGROUND)
@@ -120,7 +411,7 @@ class MainWindow:
         self.refreshButton = self.formatted_buttons(
             self.topFrame,
             text="Refresh Networks",
-            command=self.refresh_networks,
+            command=self.request_refresh,
         )
         self.aboutButton = self.formatted_buttons(
             self.topFrame, text="About", command=self.about_window
@@ -135,9 +426,7 @@ class MainWindow:
         )
 
         # Scrollbar and Treeview for displaying network information
-        self.networkListScrollbar = tk.Scrollbar(
-            self.middleFrame, bd=2, bg=BACKGROUND
-        )
+        self.networkListScrollbar = ttk.Scrollbar(self.middleFrame)
         self.networkList = ttk.Treeview(
             self.middleFrame, columns=("Network ID", "Name", "Status", "State")
         )
@@ -150,36 +439,32 @@ class MainWindow:
 
         # Bind events to the Treeview for interaction
         self.networkList.bind("<Double-Button-1>", self.call_see_network_info)
-        self.networkList.bind("<Button-1>", self.on_network_click)
-        self.networkList.bind("<<TreeviewSelect>>", lambda e: self.update_main_buttons())
+        # Release-time hit test only; click-to-select is the Treeview's
+        # own behavior and needs no handler
+        self.networkList.bind("<ButtonRelease-1>", self._clear_selection_on_empty)
+        self._pending_update = None
+        self._main_buttons_state = None
+        self.networkList.bind("<<TreeviewSelect>>", self._queue_main_buttons_update)
 
         # Buttons for network actions
         self.leaveButton = self.formatted_buttons(
             self.bottomFrame,
             text="Leave Network",
-            bg=BUTTON_BACKGROUND,
-            activebackground=BUTTON_ACTIVE_BACKGROUND,
             command=self.leave_network,
         )
         self.ztCentralButton = self.formatted_buttons(
             self.bottomFrame,
             text="ZeroTier Central",
-            bg=BUTTON_BACKGROUND,
-            activebackground=BUTTON_ACTIVE_BACKGROUND,
             command=self.zt_central,
         )
         self.toggleConnectionButton = self.formatted_buttons(
             self.bottomFrame,
             text="Disconnect/Connect Interface (Admin)",
-            bg=BUTTON_BACKGROUND,
-            activebackground=BUTTON_ACTIVE_BACKGROUND,
             command=self.toggle_interface_connection,
         )
         self.infoButton = self.formatted_buttons(
             self.bottomFrame,
             text="Network Info",
-            bg=BUTTON_BACKGROUND,
-            activebackground=BUTTON_ACTIVE_BACKGROUND,
             command=self.see_network_info,
         )
         self.infoButton["state"] = "disabled"  # Initially disabled
@@ -210,20 +495,22 @@ class MainWindow:
         self.networkList.config(yscrollcommand=self.networkListScrollbar.set)
         self.networkListScrollbar.config(command=self.networkList.yview)
 
+    # Network history, read from disk the first time it is needed so
+    # startup does no file I/O for users who never open the join dialog
+    @property
+    def network_history(self):
+        if self._network_history is None:
+            self.load_network_history()
+        return self._network_history
+
     # Loads network history from a JSON file
     def load_network_history(self):
-        history_file_path = path.join(
-            HISTORY_FILE_DIRECTORY, HISTORY_FILE_NAME
-        )
-        if not path.isfile(history_file_path):
-            makedirs(HISTORY_FILE_DIRECTORY, exist_ok=True)
-            with open(history_file_path, "w") as f:
-                pass
-        with open(history_file_path, "r") as f:
-            try:
-                self.network_history = json.load(f)
-            except JSONDecodeError:
-                self.network_history = {}
+        try:
+            with open(HISTORY_FILE_PATH, "rb") as f:
+                self._network_history = _json_loads(f.read())
+        except (FileNotFoundError, ValueError):
+            self._network_history = {}
+        self._history_dirty = False
 
     # Opens the ZeroTier Central website in a browser
     def zt_central(self):
@@ -233,103 +520,209 @@ class MainWindow:
     def call_see_network_info(self, event):
         self.see_network_info()
 
-    # Refreshes the list of paths for a specific peer
-    def refresh_paths(self, pathsList, idInList):
-        pathsList.delete(*pathsList.get_children())
-        pathsData = self.get_peers_info()[idInList]["paths"]
-        data = [
-            (
-              path["active"],
-              path["address"],
-              path["expired"],
-              path["lastReceive"],
-              path["lastSend"],
-              path["preferred"],
-              path["trustedPathId"]
+    # Refreshes the list of paths for a specific peer; paths_provider is
+    # a zero-arg callable returning the latest paths list so this method
+    # never has to re-locate the peer itself
+    def refresh_paths(self, pathsList, paths_provider):
+        self._submit(
+            lambda: self._collect_path_rows(paths_provider),
+            lambda fut: self._apply_rows(pathsList, fut),
+        )
+
+    # Worker-side fetch of the path rows for one peer; stringifies each
+    # row straight from the JSON dict in a single pass
+    def _collect_path_rows(self, paths_provider):
+        pathsData = paths_provider()
+        return {
+            p["address"]: (
+                (str(p["active"]),
+                 p["address"],
+                 str(p["expired"]),
+                 str(p["lastReceive"]),
+                 str(p["lastSend"]),
+                 str(p["preferred"]),
+                 str(p["trustedPathId"])),
+                (),
             )
-            for path in pathsData
-        ]
-        for tup in data:
-            pathsList.insert("", "end", values=tuple(str(v) for v in tup))
+            for p in pathsData
+        }
+
+    # Main-thread application of rows collected on the worker
+    def _apply_rows(self, tree, future):
+        if not tree.winfo_exists():
+            return
+        self._diff_treeview(tree, future.result())
+
+    # Rows inserted per event-loop pass when populating a large list
+    _PEER_CHUNK = 50
 
     # Refreshes the list of peers
     def refresh_peers(self, peersList):
-        peersList.delete(*peersList.get_children())
+        self._submit_shared(
+            "peers",
+            self._collect_peer_rows,
+            lambda fut: self._apply_peer_rows(peersList, fut),
+        )
+
+    # Applies peer rows; small lists are diffed in place, large ones
+    # insert a screenful immediately and the remainder in after_idle
+    # batches so the first paint is never stalled by hundreds of peers.
+    # (Chunked insertion rather than true scroll virtualization keeps
+    # ttk's own yview/scrollbar wiring intact.)
+    def _apply_peer_rows(self, tree, future):
+        if not tree.winfo_exists():
+            return
+        # Every apply invalidates any batch chain still running — the
+        # diff path too, or a draining chain from a previous chunked
+        # populate would resume inserting stale rows over the fresh ones
+        generation = getattr(tree, "_populate_generation", 0) + 1
+        tree._populate_generation = generation
+        new_rows = future.result()
+        if len(new_rows) <= self._PEER_CHUNK:
+            self._diff_treeview(tree, new_rows)
+            return
+
+        tree.delete(*tree.get_children())
+        items = list(new_rows.items())
+
+        def insert_batch(start):
+            if (
+                not tree.winfo_exists()
+                or tree._populate_generation != generation
+            ):
+                return
+            for iid, (values, tags) in items[start:start + self._PEER_CHUNK]:
+                tree.insert("", "end", iid=iid, values=values, tags=tags)
+            if start + self._PEER_CHUNK < len(items):
+                tree.after_idle(insert_batch, start + self._PEER_CHUNK)
+
+        insert_batch(0)
+
+    # Worker-side fetch of the peer rows
+    def _collect_peer_rows(self):
         peersData = self.get_peers_info()
-        data = [
-            (peer["address"], "-" if peer["version"] == "-1.-1.-1" else peer["version"],
-             peer["role"], peer["latency"])
+        return {
+            peer["address"]: (
+                (peer["address"],
+                 "-" if peer["version"] == "-1.-1.-1" else peer["version"],
+                 peer["role"], peer["latency"]),
+                (),
+            )
             for peer in peersData
-        ]
-        for peerAddress, peerVersion, peerRole, peerLatency in data:
-            peersList.insert("", "end", values=(peerAddress, peerVersion, peerRole, peerLatency))
+        }
+
+    # Coalesces bursts of refresh requests (join + history update +
+    # manual refresh can land within milliseconds of each other) into a
+    # single refresh_networks once the burst settles
+    def request_refresh(self, delay_ms=200):
+        if self._refresh_pending is not None:
+            self.window.after_cancel(self._refresh_pending)
+        self._refresh_pending = self.window.after(
+            delay_ms, self._do_refresh
+        )
+
+    def _do_refresh(self):
+        self._refresh_pending = None
+        self.refresh_networks()
 
     # Refreshes the list of networks
     def refresh_networks(self):
-        self.networkList.delete(*self.networkList.get_children())
+        self._invalidate_cache()
+        self._submit_shared(
+            "networks", self._collect_network_rows, self._apply_network_rows
+        )
+
+    # Worker-side fetch of the network list and interface states
+    def _collect_network_rows(self):
         networkData = self.get_networks_info()
-        data = [
-            (net["id"],
-             net["name"] or "Unknown Name",
-             net["status"],
-             self.get_interface_state(self.get_interface_name(i))
+        interfaceStates = self._get_all_interface_states()
+        new_rows = {}
+        for net in networkData:
+            state = interfaceStates.get(
+                self._interface_name_from_net(net), "UNKNOWN"
             )
-            for i, net in enumerate(networkData)
-        ]
-        for networkId, networkName, networkStatus, state in data:
-            if not networkName:
-                networkName = "Unknown Name"
-            if state.lower() == "disabled":
-                self.networkList.insert("", "end", values=(networkId, networkName, networkStatus, state),
-                                        tags=("down",))
-            else:
-                self.networkList.insert("", "end", values=(networkId, networkName, networkStatus, state))
+            values = (net["id"], net["name"] or "Unknown Name", net["status"], state)
+            tags = ("down",) if state.lower() == "disabled" else ()
+            new_rows[net["id"]] = (values, tags)
+        return networkData, new_rows
+
+    # Main-thread application of the collected network rows
+    def _apply_network_rows(self, future):
+        networkData, new_rows = future.result()
+        self._diff_treeview(self.networkList, new_rows)
         self.networkList.tag_configure("down", background="#ffcccc")
+        # get_networks_info already rebuilt _networks_by_id when the
+        # worker fetched networkData; only the history names need a sync
         self.update_network_history_names()
 
-    # Updates network history with names from the current network list
+    # Updates network history with names from the last fetched network list
     def update_network_history_names(self):
-        networks = self.get_networks_info()
-        for network in networks:
-            network_id = network["nwid"]
-            network_name = network["name"]
-            if network_id in self.network_history:
-                self.network_history[network_id]["name"] = network_name
-
-    # Saves network history to a JSON file
+        if self._network_history is None:
+            # Not loaded yet; nothing to sync until the join dialog needs it
+            return
+        for network_id in self.network_history.keys() & self._networks_by_id.keys():
+            name = self._networks_by_id[network_id]["name"]
+            if self.network_history[network_id]["name"] != name:
+                self.network_history[network_id]["name"] = name
+                self._history_dirty = True
+
+    # Saves network history to a JSON file; written to a temp file and
+    # renamed into place so a crash mid-write can't corrupt the history.
+    # Skipped entirely when nothing changed since load.
     def save_network_history(self):
-        history_file_path = path.join(
-            HISTORY_FILE_DIRECTORY, HISTORY_FILE_NAME
-        )
-        with open(history_file_path, "w") as f:
-            json.dump(self.network_history, f)
+        if self._network_history is None or not self._history_dirty:
+            return
+        makedirs(HISTORY_FILE_DIRECTORY, exist_ok=True)
+        temp_file_path = HISTORY_FILE_PATH + ".tmp"
+        with open(temp_file_path, "wb") as f:
+            f.write(_json_dumps(self.network_history))
+        replace(temp_file_path, HISTORY_FILE_PATH)
+        self._history_dirty = False
 
     # Retrieves the name of a network by its ID
     def get_network_name_by_id(self, network_id):
-        networks = self.get_networks_info()
-        for network in networks:
-            if network_id == network["nwid"]:
-                return network["name"]
+        # a just-joined network isn't in the lookup map yet; fetching
+        # refreshes the map (served from cache when it's warm)
+        if network_id not in self._networks_by_id:
+            self.get_networks_info()
+        net = self._networks_by_id.get(network_id)
+        return net["name"] if net else None
 
     # Retrieves information about all networks
     def get_networks_info(self):
-        cmd = "zerotier-cli -j listnetworks"
-        data = self._execute_command(cmd)
-        return json.loads(data) if data else {}
+        data = self._zt_get("/network", ttl=2.0)
+        if data is None:
+            data = self._execute_json_command(
+                ("zerotier-cli", "-j", "listnetworks"), ttl=2.0
+            )
+        # by-id lookup map, refreshed alongside every fetch
+        self._networks_by_id = {net["id"]: net for net in data}
+        return data
 
     # Retrieves information about all peers
     def get_peers_info(self):
-        cmd = "zerotier-cli -j peers"
-        data = self._execute_command(cmd)
-        return json.loads(data) if data else {}
+        data = self._zt_get("/peer", ttl=2.0)
+        if data is not None:
+            return data
+        return self._execute_json_command(("zerotier-cli", "-j", "peers"), ttl=2.0)
 
-    # Retrieves the status of ZeroTier
+    # Retrieves the status of ZeroTier in the CLI's token layout
     def get_status(self):
-        cmd = "zerotier-cli status"
-        data = self._execute_command(cmd)
-        return data.split() if data else []
-
-    # Launches a sub-window with a specified title
+        status = self._zt_get("/status", ttl=2.0)
+        if status is not None:
+            return [
+                "200",
+                "info",
+                status.get("address", "-"),
+                status.get("version", "-"),
+                "ONLINE" if status.get("online") else "OFFLINE",
+            ]
+        data = self._execute_command(("zerotier-cli", "status"), ttl=2.0)
+        return data.decode().split() if data else []
+
+    # Launches a sub-window with a specified title. Sub-windows are
+    # Toplevels serviced by the one root mainloop; callers must never
+    # start a nested mainloop on them.
     def launch_sub_window(self, title):
         subWindow = tk.Toplevel(self.window, class_="zerotier-gui")
         subWindow.title(title)
@@ -337,102 +730,80 @@ class MainWindow:
 
         return subWindow
 
-    # Creates a selectable text widget
-    def selectable_text(
-        self, frame, text, justify="left", font="TkDefaultFont"
-    ):
-        entry = tk.Entry(
-            frame,
-            relief=tk.FLAT,
-            bg=BACKGROUND,
-            highlightthickness=0,
-            highlightcolor=BACKGROUND,
-            fg=FOREGROUND,
-            selectforeground=FOREGROUND,
-            selectborderwidth=0,
-            justify=justify,
-            font=font,
-            bd=0,
+    # Creates a formatted button widget picking up the shared style
+    def formatted_buttons(self, frame, text="", command=""):
+        return ttk.Button(
+            frame, text=text, style="Orange.TButton", command=command
         )
-        entry.insert(0, text)
-        entry.config(state="readonly", width=len(text))
-
-        return entry
-
-    # Creates a formatted button widget
-    def formatted_buttons(
-        self,
-        frame,
-        text="",
-        bg=BUTTON_BACKGROUND,
-        fg=FOREGROUND,
-        justify="left",
-        activebackground=BUTTON_ACTIVE_BACKGROUND,
-        command="",
-        activeforeground=FOREGROUND,
-    ):
-        button = tk.Button(
-            frame,
-            text=text,
-            bg=bg,
-            fg=fg,
-            justify=justify,
-            activebackground=activebackground,
-            activeforeground=activeforeground,
-            command=command,
-        )
-        return button
 
     # Adds a network to the history
     def add_network_to_history(self, network_id):
         network_name = self.get_network_name_by_id(network_id)
-        date = datetime.now()
-        join_date = f"{date.year}/{date.month:0>2}/{date.day:0>2} {date.hour:0>2}:{date.minute:0>2}"
+        join_date = datetime.now().strftime("%Y/%m/%d %H:%M")
         self.network_history[network_id] = {
             "name": network_name,
             "join_date": join_date,
         }
+        self._history_dirty = True
 
     # Checks if the user is currently on a network
     def is_on_network(self, network_id):
-        return any(network["nwid"] == network_id for network in self.get_networks_info())
+        return network_id in self._networks_by_id
 
     # Creates a window for joining a network
     def create_join_network_window(self):
         def join_network(network_id):
-            try:
-                if self.is_on_network(network_id):
-                    join_result = "You're already a member of this network."
-                    messagebox.showinfo(
-                        icon="info", message=join_result, parent=join_window
-                    )
-                    return
-                check_output(["cmd", "/c", "zerotier-cli", "join", network_id])
-                join_result = "Successfully joined network"
-                self.add_network_to_history(network_id)
+            if self.is_on_network(network_id):
+                join_result = "You're already a member of this network."
                 messagebox.showinfo(
                     icon="info", message=join_result, parent=join_window
                 )
-                self.refresh_networks()
-                join_window.destroy()
+                return
+            self._submit(
+                lambda: check_output(
+                    [self._zt_cli, "join", network_id],
+                    stderr=STDOUT,
+                    creationflags=CREATE_NO_WINDOW,
+                ),
+                lambda fut: on_join_done(network_id, fut),
+            )
+
+        def on_join_done(network_id, future):
+            if not join_window.winfo_exists():
+                return
+            try:
+                future.result()
             except CalledProcessError:
-                join_result = "Invalid network ID"
                 messagebox.showinfo(
-                    icon="error", message=join_result, parent=join_window
+                    icon="error", message="Invalid network ID",
+                    parent=join_window
                 )
+                return
+            self._invalidate_cache()
+            self.add_network_to_history(network_id)
+            messagebox.showinfo(
+                icon="info", message="Successfully joined network",
+                parent=join_window
+            )
+            self.request_refresh()
+            join_window.destroy()
 
         def populate_network_list():
-            network_history_list.delete(*network_history_list.get_children())
-            for network_id in self.network_history:
-                network_name = self.network_history[network_id]["name"]
-                if network_name == "":
-                    network_name = "Unknown Name"
-                network_history_list.insert("", "end", values=(network_name, network_id))
+            self._diff_treeview(
+                network_history_list,
+                {
+                    network_id: (
+                        (entry["name"] or "Unknown Name", network_id),
+                        (),
+                    )
+                    for network_id, entry in self.network_history.items()
+                },
+            )
 
         def populate_info_sidebar():
             selected_item = network_history_list.focus()
             if selected_item != "":
-                item_info = network_history_list.item(selected_item)["values"]
+                item_info = network_history_list.item(selected_item, "values")
                 network_id = item_info[1]
                 join_date = self.network_history[network_id]["join_date"]
                 network_name = self.network_history[network_id]["name"]
@@ -445,32 +816,33 @@ class MainWindow:
                 currently_joined = "-"
                 network_name = "-"
             network_id_label.configure(
-                text="{:20s}{}".format("Network ID:", network_id)
+                text=_SIDEBAR_FMT("Network ID:", network_id)
             )
             network_name_label.configure(
-                text="{:20s}{}".format("Name:", network_name)
+                text=_SIDEBAR_FMT("Name:", network_name)
             )
             last_joined_label.configure(
-                text="{:20s}{}".format("Last joined date:", join_date)
+                text=_SIDEBAR_FMT("Last joined date:", join_date)
             )
             currently_joined_label.configure(
-                text="{:20s}{}".format("Currently joined:", currently_joined)
+                text=_SIDEBAR_FMT("Currently joined:", currently_joined)
             )
 
         def on_network_selected(event):
             populate_info_sidebar()
             selected_item = network_history_list.focus()
-            item_info = network_history_list.item(selected_item)["values"]
+            item_info = network_history_list.item(selected_item, "values")
             network_id = item_info[1]
             network_entry_value.set(network_id)
 
         def delete_history_entry():
             selected_item = network_history_list.focus()
-            item_info = network_history_list.item(selected_item).get("values", [])
+            item_info = network_history_list.item(selected_item, "values") or ()
             if len(item_info) < 2:
                 return
             network_id = item_info[1]
-            self.network_history.pop(network_id, None)
+            if self.network_history.pop(network_id, None) is not None:
+                self._history_dirty = True
             populate_network_list()
 
         join_window = self.launch_sub_window("Join Network")
@@ -506,14 +878,12 @@ class MainWindow:
             command=delete_history_entry,
         )
 
-        join_title = tk.Label(main_frame, text="Join Network", font="Monospace", bg=BACKGROUND, fg=FOREGROUND)
+        join_title = tk.Label(main_frame, text="Join Network", **LABEL_OPTS)
         join_title.grid(row=0, column=0, columnspan=2, pady=(0,10))
         network_history_list = ttk.Treeview(left_frame, columns=("Network",))
         self._configure_treeview(network_history_list, ["Network"], [300], ["Network"])
         network_history_list.configure(height=20, style="NoBackground.Treeview")
-        network_history_scrollbar = tk.Scrollbar(
-            left_frame, bd=2, bg=BACKGROUND
-        )
+        network_history_scrollbar = ttk.Scrollbar(left_frame)
         network_history_list.config(
             yscrollcommand=network_history_scrollbar.set
         )
@@ -574,47 +944,76 @@ class MainWindow:
         selected = self.networkList.focus()
         if not selected:
             return
-        selectionInfo = self.networkList.item(selected)
-        network = selectionInfo["values"][0]
-        networkName = selectionInfo["values"][1]
+        selectionInfo = self.networkList.item(selected, "values")
+        network = selectionInfo[0]
+        networkName = selectionInfo[1]
         answer = messagebox.askyesno(
             title="Leave Network",
             message=f"Are you sure you want to "
             f'leave "{networkName}" (ID: {network})?',
         )
-        if answer:
-            try:
-                check_output(["cmd", "/c", "zerotier-cli", "leave", network])
-                leaveResult = "Successfully left network"
-            except CalledProcessError:
-                leaveResult = "Error"
-        else:
+        if not answer:
             return
+        self._submit(
+            lambda: check_output(
+                [self._zt_cli, "leave", network],
+                stderr=STDOUT,
+                creationflags=CREATE_NO_WINDOW,
+            ),
+            self._on_leave_done,
+        )
+
+    # Reports the result of an asynchronous leave and refreshes
+    def _on_leave_done(self, future):
+        try:
+            future.result()
+            self._invalidate_cache()
+            leaveResult = "Successfully left network"
+        except CalledProcessError:
+            leaveResult = "Error"
         messagebox.showinfo(icon="info", message=leaveResult)
-        self.refresh_networks()
+        self.request_refresh()
 
     # Displays the About window
     def about_window(self):
         statusWindow = self.launch_sub_window("About")
-        status = self.get_status()
-        
+        # Kept as a transient of the root so the window manager stacks
+        # it with the main window; the root mainloop services it, no
+        # nested event loop needed
+        statusWindow.transient(self.window)
+
         contentFrame = tk.Frame(statusWindow, bg=BACKGROUND, padx=20, pady=20)
         contentFrame.grid(row=0, column=0, sticky="nsew")
         statusWindow.grid_rowconfigure(0, weight=1)
         statusWindow.grid_columnconfigure(0, weight=1)
-        
-        titleLabel = tk.Label(contentFrame, text="ZeroTier GUI", font=("TkDefaultFont", 18, "bold"), bg=BACKGROUND, fg=FOREGROUND)
+
+        titleLabel = ttk.Label(contentFrame, text="ZeroTier GUI", style="InfoTitle.TLabel")
         titleLabel.grid(row=0, column=0, columnspan=2, pady=(0,10))
-        
+
+        # The window opens immediately with placeholders; the status
+        # fetch (a subprocess on a cold cache) fills them in off-thread
         labels = ["My ZeroTier Address:", "ZeroTier Version:", "ZeroTier GUI Version:", "Status:"]
-        values = [status[2], status[3], "1.4.0 (Windows)", status[4]]
-        for i, (lab, val) in enumerate(zip(labels, values), start=1):
-            l = tk.Label(contentFrame, text=lab, font="Monospace", bg=BACKGROUND, fg=FOREGROUND)
-            v = tk.Label(contentFrame, text=val, font="Monospace", bg=BACKGROUND, fg=FOREGROUND)
+        addressVar = tk.StringVar(value="-")
+        versionVar = tk.StringVar(value="-")
+        onlineVar = tk.StringVar(value="-")
+        variables = [addressVar, versionVar, tk.StringVar(value="1.4.0 (Windows)"), onlineVar]
+        for i, (lab, var) in enumerate(zip(labels, variables), start=1):
+            l = ttk.Label(contentFrame, text=lab, style="Info.TLabel")
+            v = ttk.Label(contentFrame, textvariable=var, style="Info.TLabel")
             l.grid(row=i, column=0, sticky="e", padx=(0,5), pady=2)
             v.grid(row=i, column=1, sticky="w", pady=2)
-        
-        closeButton = self.formatted_buttons(contentFrame, text="Close", bg=BUTTON_BACKGROUND, activebackground=BUTTON_ACTIVE_BACKGROUND, command=statusWindow.destroy)
+
+        def apply_status(future):
+            if not statusWindow.winfo_exists():
+                return
+            status = future.result()
+            addressVar.set(status[2] if len(status) > 2 else "-")
+            versionVar.set(status[3] if len(status) > 3 else "-")
+            onlineVar.set(status[4] if len(status) > 4 else "-")
+
+        self._submit(self.get_status, apply_status)
+
+        closeButton = self.formatted_buttons(contentFrame, text="Close", command=statusWindow.destroy)
         closeButton.grid(row=i+1, column=0, columnspan=2, pady=(10,0), padx=10)
         
         creditsLabel = tk.Label(contentFrame, text="GUI created by Tomás Ralph", bg=BACKGROUND, fg=FOREGROUND)
@@ -622,32 +1021,34 @@ class MainWindow:
         creditsLink.bind("<Button-1>", lambda e: open_new_tab("https://github.com/tralph3/zerotier-gui"))
         creditsLabel.grid(row=i+2, column=0, columnspan=2, pady=(10,0))
         creditsLink.grid(row=i+3, column=0, columnspan=2)
-        
-        statusWindow.mainloop()
 
-    # Retrieves the state of a network interface
-    def get_interface_state(self, interface):
-        # Skip the first two lines (header and separator)
+    # Parses `netsh interface show interface` once into a
+    # {name: "Enabled"/"Disabled"} dict so a whole refresh pays for a
+    # single netsh spawn instead of one per network row
+    def _get_all_interface_states(self):
         try:
             output = check_output(["netsh", "interface", "show", "interface"], stderr=STDOUT).decode(errors="replace")
         except CalledProcessError:
-            return "UNKNOWN"
-        lines = output.splitlines()
-        import re
-        pattern = re.compile(r"^(?P<admin>\S+)\s+(?P<state>\S+)\s+(?P<type>\S+)\s+(?P<name>.+)$")
-        for line in lines[2:]:
-            match = pattern.match(line)
-            if match:
-                name = match.group("name").strip()
-                if name == interface:
-                    admin_state = match.group("admin").strip().lower()
-                    if admin_state.startswith("a") or admin_state.startswith("e"):
-                        return "Enabled"
-                    elif admin_state.startswith("d"):
-                        return "Disabled"
-                    else:
-                        return admin_state
-        return "UNKNOWN"
+            return {}
+        # Skip the first two lines (header and separator) without the
+        # list copy a [2:] slice would make
+        states = {}
+        for line in islice(output.splitlines(), 2, None):
+            match = _NETSH_IFACE_RE.match(line)
+            if not match:
+                continue
+            admin_state = match.group("admin").strip().lower()
+            if admin_state.startswith("a") or admin_state.startswith("e"):
+                admin_state = "Enabled"
+            elif admin_state.startswith("d"):
+                admin_state = "Disabled"
+            states[match.group("name").strip()] = admin_state
+        return states
+
+    # Retrieves the state of a network interface; thin wrapper over the
+    # batched table for single-shot callers
+    def get_interface_state(self, interface):
+        return self._get_all_interface_states().get(interface, "UNKNOWN")
 
     # Toggles the connection state of a network interface
     def toggle_interface_connection(self):
@@ -667,21 +1068,25 @@ class MainWindow:
         if not self._is_admin():
             answer = messagebox.askyesno("Admin rights required", "Administrative rights are required. Relaunch with elevated privileges?")
             if answer:
-                ctypes.windll.shell32.ShellExecuteW(None, "runas", sys.executable, __file__, None, 0)  # SW_HIDE = 0
+                _shell32.ShellExecuteW(None, "runas", sys.executable, __file__, None, 0)  # SW_HIDE = 0
                 sys.exit(0)
             else:
                 return
 
         # Automatically toggle based on the current state without additional confirmation
         state = self.get_interface_state(interfaceName)
-        if state.lower() == "disabled":
-            command = f'netsh interface set interface name="{interfaceName}" admin=ENABLED'
-        else:
-            command = f'netsh interface set interface name="{interfaceName}" admin=DISABLED'
+        admin = "ENABLED" if state.lower() == "disabled" else "DISABLED"
 
         try:
-            check_output(command, shell=True, stderr=STDOUT)
-            self.refresh_networks()
+            check_output(
+                [
+                    "netsh", "interface", "set", "interface",
+                    f"name={interfaceName}", f"admin={admin}",
+                ],
+                stderr=STDOUT,
+                creationflags=CREATE_NO_WINDOW,
+            )
+            self.request_refresh()
         except CalledProcessError as e:
             messagebox.showerror("Error", f"Error toggling interface:\n{e.output.decode(errors='replace')}")
 
@@ -690,17 +1095,24 @@ class MainWindow:
         selected = peerList.focus()
         if not selected:
             return
-        info = peerList.item(selected)
-        if not info.get("values"):
+        values = peerList.item(selected, "values")
+        if not values:
             return
-        peerId = info["values"][0]
-        peers_info = self.get_peers_info()
-        idx = None
-        for i, peer in enumerate(peers_info):
-            if peer.get("address") == peerId:
-                idx = i
-                break
-        if idx is None:
+        peerId = values[0]
+
+        # Resolves the selected peer from the (cached) peer list through
+        # an address-keyed map rather than a per-call scan
+        def find_peer():
+            by_addr = {
+                peer.get("address"): peer for peer in self.get_peers_info()
+            }
+            return by_addr.get(peerId)
+
+        def paths_provider():
+            peer = find_peer()
+            return peer.get("paths", []) if peer else []
+
+        if find_peer() is None:
             return
 
         pathsWindow = self.launch_sub_window("Peer Path")
@@ -712,7 +1124,7 @@ class MainWindow:
 
         peerIdLabel = tk.Label(topFrame, font=40, bg=BACKGROUND, fg=FOREGROUND,
                                 text=f'Seeing paths for peer with ID "{str(peerId)}"')
-        pathsListScrollbar = tk.Scrollbar(middleFrame, bd=2, bg=BACKGROUND)
+        pathsListScrollbar = ttk.Scrollbar(middleFrame)
         pathsList = ttk.Treeview(middleFrame, columns=("Active", "Address", "Expired", "Last Receive", "Last Send", "Preferred", "Trusted Path ID"))
         self._configure_treeview(
             pathsList,
@@ -726,7 +1138,7 @@ class MainWindow:
         pathsList.pack(side="bottom", fill="x")
 
         closeButton = self.formatted_buttons(bottomFrame, text="Close", command=lambda: pathsWindow.destroy())
-        refreshButton = self.formatted_buttons(bottomFrame, text="Refresh Paths", command=lambda: self.refresh_paths(pathsList, idx))
+        refreshButton = self.formatted_buttons(bottomFrame, text="Refresh Paths", command=lambda: self.refresh_paths(pathsList, paths_provider))
         closeButton.pack(side="left", fill="x", padx=10)
         refreshButton.pack(side="right", fill="x", padx=10)
 
@@ -734,22 +1146,98 @@ class MainWindow:
         middleFrame.pack(side="top", fill="x")
         bottomFrame.pack(side="top", fill="x")
 
-        self.refresh_paths(pathsList, idx)
+        self.refresh_paths(pathsList, paths_provider)
         pathsList.config(yscrollcommand=pathsListScrollbar.set)
         pathsListScrollbar.config(command=pathsList.yview)
 
-        pathsWindow.mainloop()
-
     # Displays the peers window
     def see_peers(self):
+        # Reuse the window built on the first open; just re-show it
+        # with fresh data instead of rebuilding the widget tree
+        if (
+            self._peers_window is not None
+            and self._peers_window.winfo_exists()
+        ):
+            self._peers_window.deiconify()
+            self._peers_refresh()
+            return
+
         def call_see_peer_paths(_event):
             self.see_peer_paths(peersList)
 
         def update_peers_buttons_state():
-            if peersList.selection():
-                seePathsButton["state"] = "normal"
+            # one selection query, then the ttk state API — a single
+            # Tcl call instead of the dict-style option round-trip
+            has_sel = bool(peersList.selection())
+            seePathsButton.state(("!disabled",) if has_sel else ("disabled",))
+
+        # Coalesces bursts of refresh clicks into one repopulation
+        refresh_pending = None
+
+        def schedule_refresh():
+            nonlocal refresh_pending
+            if refresh_pending is not None:
+                return
+            refresh_pending = peersWindow.after(20, do_refresh)
+
+        def do_refresh():
+            nonlocal refresh_pending
+            refresh_pending = None
+            self.refresh_peers(peersList)
+
+        # Adaptive auto-refresh: poll quickly while the peer data is
+        # changing, back off geometrically while it is stable
+        poll_state = {"interval": 500, "snapshot": None, "focused": True}
+
+        def poll_delay():
+            # nobody is reading an unfocused window; hold the poll at
+            # the adaptive cap however busy the data is
+            if poll_state["focused"]:
+                return poll_state["interval"]
+            return max(poll_state["interval"], 5000)
+
+        def on_focus_in(_event):
+            poll_state["focused"] = True
+
+        def on_focus_out(_event):
+            poll_state["focused"] = False
+
+        def poll_peers():
+            if not peersWindow.winfo_exists():
+                return
+            if peersWindow.state() == "withdrawn":
+                # keep the timer alive but skip fetching while hidden
+                peersWindow.after(poll_delay(), poll_peers)
+                return
+            self._submit(self._collect_peer_rows, on_poll_done)
+
+        def on_poll_done(future):
+            if not peersWindow.winfo_exists():
+                return
+            rows = future.result()
+            snapshot = hash(
+                tuple(sorted((iid, values) for iid, (values, _tags) in rows.items()))
+            )
+            if snapshot == poll_state["snapshot"]:
+                poll_state["interval"] = min(poll_state["interval"] * 2, 5000)
             else:
-                seePathsButton["state"] = "disabled"
+                poll_state["snapshot"] = snapshot
+                poll_state["interval"] = 250
+                self._apply_peer_rows(peersList, future)
+            peersWindow.after(poll_delay(), poll_peers)
+
+        # Debounced counterpart, mirroring _queue_main_buttons_update
+        peers_update_pending = None
+
+        def queue_peers_buttons_update(_event=None):
+            nonlocal peers_update_pending
+            if peers_update_pending is None:
+                peers_update_pending = peersWindow.after_idle(flush_peers_buttons)
+
+        def flush_peers_buttons():
+            nonlocal peers_update_pending
+            peers_update_pending = None
+            update_peers_buttons_state()
 
         peersWindow = self.launch_sub_window("Peers")
         peersWindow.configure(bg=BACKGROUND)
@@ -758,7 +1246,7 @@ class MainWindow:
         middleFrame = tk.Frame(peersWindow, padx=20, bg=BACKGROUND)
         bottomFrame = tk.Frame(peersWindow, padx=20, pady=10, bg=BACKGROUND)
 
-        peersListScrollbar = tk.Scrollbar(middleFrame, bd=2, bg=BACKGROUND)
+        peersListScrollbar = ttk.Scrollbar(middleFrame)
         peersList = ttk.Treeview(
             middleFrame, columns=("ZT Address", "Version", "Role", "Latency")
         )
@@ -770,136 +1258,175 @@ class MainWindow:
         )
 
         peersList.bind("<Double-Button-1>", call_see_peer_paths)
-        peersList.bind("<<TreeviewSelect>>", lambda e: update_peers_buttons_state())
-
-        closeButton = self.formatted_buttons(
-            bottomFrame,
-            text="Close",
-            bg=BUTTON_BACKGROUND,
-            activebackground=BUTTON_ACTIVE_BACKGROUND,
-            command=lambda: peersWindow.destroy(),
-        )
-        refreshButton = self.formatted_buttons(
-            bottomFrame,
-            text="Refresh Peers",
-            bg=BUTTON_BACKGROUND,
-            activebackground=BUTTON_ACTIVE_BACKGROUND,
-            command=lambda: self.refresh_peers(peersList),
-        )
-        seePathsButton = self.formatted_buttons(
-            bottomFrame,
-            text="See Paths",
-            bg=BUTTON_BACKGROUND,
-            activebackground=BUTTON_ACTIVE_BACKGROUND,
-            command=lambda: self.see_peer_paths(peersList),
-        )
-        seePathsButton["state"] = "disabled"
+        # add="+" keeps any future select bindings composable instead of
+        # silently replacing this one
+        peersList.bind(
+            "<<TreeviewSelect>>", queue_peers_buttons_update, add="+"
+        )
+        peersWindow.bind("<FocusIn>", on_focus_in, add="+")
+        peersWindow.bind("<FocusOut>", on_focus_out, add="+")
+
+        # One loop builds and packs the row of buttons from a spec
+        buttons = {}
+        for text, command, side in (
+            ("Close", peersWindow.withdraw, "left"),
+            ("Refresh Peers", schedule_refresh, "right"),
+            ("See Paths", lambda: self.see_peer_paths(peersList), "right"),
+        ):
+            button = self.formatted_buttons(
+                bottomFrame, text=text, command=command
+            )
+            button.pack(side=side, fill="x", padx=10)
+            buttons[text] = button
+        seePathsButton = buttons["See Paths"]
+        seePathsButton.state(("disabled",))
 
         peersListScrollbar.pack(side="right", fill="both")
         peersList.pack(side="bottom", fill="x")
 
-        closeButton.pack(side="left", fill="x", padx=10)
-        refreshButton.pack(side="right", fill="x", padx=10)
-        seePathsButton.pack(side="right", fill="x", padx=10)
-
         topFrame.pack(side="top", fill="x", pady=(30, 0))
         middleFrame.pack(side="top", fill="x")
         bottomFrame.pack(side="top", fill="x")
-        self.refresh_peers(peersList)
+        # first fetch runs once the window has painted; later refreshes
+        # go through the debounced scheduler or the adaptive poller
+        peersWindow.after_idle(do_refresh)
+        peersWindow.after(poll_delay(), poll_peers)
 
         peersList.config(yscrollcommand=peersListScrollbar.set)
         peersListScrollbar.config(command=peersList.yview)
 
-        peersWindow.mainloop()
-
-    # Displays information about a selected network
+        peersWindow.protocol("WM_DELETE_WINDOW", peersWindow.withdraw)
+        self._peers_window = peersWindow
+        self._peers_refresh = do_refresh
+
+    # (label, JSON key) pairs shown in the info window; a None key
+    # renders a fixed value
+    _INFO_FIELDS = (
+        ("Name:", "name"),
+        ("Network ID:", "id"),
+        ("Status:", "status"),
+        ("State:", None),
+        ("Type:", "type"),
+        ("Device:", "portDeviceName"),
+        ("Bridge:", "bridge"),
+        ("MAC Address:", "mac"),
+        ("MTU:", "mtu"),
+        ("DHCP:", "dhcp"),
+    )
+
+    # Displays information about a selected network, reusing one hidden
+    # Toplevel so repeat opens only rewrite the value labels
     def see_network_info(self):
         selected = self.networkList.focus()
         if not selected:
             return
-        selectionInfo = self.networkList.item(selected).get("values", [])
+        selectionInfo = self.networkList.item(selected, "values") or ()
         if not selectionInfo:
             return
-        network_id = selectionInfo[0]
-        networks = self.get_networks_info()
-        currentNetworkInfo = next((net for net in networks if net.get("id") == network_id or net.get("nwid") == network_id), None)
+        network_id = str(selectionInfo[0])
+        currentNetworkInfo = self._networks_by_id.get(network_id)
         if currentNetworkInfo is None:
             return
 
+        if self._info_window is None or not self._info_window.winfo_exists():
+            self._build_info_window()
+        self._populate_info_window(currentNetworkInfo)
+        self._info_window.transient(self.window)
+        self._info_window.deiconify()
+        self._info_window.grab_set()
+
+    # One-time construction of the Network Info window. All fields
+    # render into one read-only Text widget — a single widget and one
+    # layout pass instead of two Labels gridded per field.
+    def _build_info_window(self):
         infoWindow = self.launch_sub_window("Network Info")
         contentFrame = tk.Frame(infoWindow, bg=BACKGROUND, padx=20, pady=20)
         contentFrame.grid(row=0, column=0, sticky="nsew")
         infoWindow.grid_rowconfigure(0, weight=1)
         infoWindow.grid_columnconfigure(0, weight=1)
 
-        titleLabel = tk.Label(contentFrame, text="Network Info", font=("TkDefaultFont", 18, "bold"), bg=BACKGROUND, fg=FOREGROUND)
-        titleLabel.grid(row=0, column=0, columnspan=2, pady=(0,10))
+        titleLabel = ttk.Label(contentFrame, text="Network Info", style="InfoTitle.TLabel")
+        titleLabel.grid(row=0, column=0, pady=(0,10))
 
-        fields = [
-            ("Name:", currentNetworkInfo.get("name", "N/A")),
-            ("Network ID:", currentNetworkInfo.get("id", "N/A")),
-            ("Status:", currentNetworkInfo.get("status", "N/A")),
-            ("State:", "UP"),
-            ("Type:", currentNetworkInfo.get("type", "N/A")),
-            ("Device:", currentNetworkInfo.get("portDeviceName", "N/A")),
-            ("Bridge:", currentNetworkInfo.get("bridge", "N/A")),
-            ("MAC Address:", currentNetworkInfo.get("mac", "N/A")),
-            ("MTU:", currentNetworkInfo.get("mtu", "N/A")),
-            ("DHCP:", currentNetworkInfo.get("dhcp", "N/A"))
-        ]
-        for i, (lab, val) in enumerate(fields, start=1):
-            l = tk.Label(contentFrame, text=lab, font="Monospace", bg=BACKGROUND, fg=FOREGROUND)
-            v = tk.Label(contentFrame, text=val, font="Monospace", bg=BACKGROUND, fg=FOREGROUND)
-            l.grid(row=i, column=0, sticky="e", padx=(0,5), pady=2)
-            v.grid(row=i, column=1, sticky="w", pady=2)
+        infoText = tk.Text(
+            contentFrame,
+            width=48,
+            font=self.mono,
+            bg=BACKGROUND,
+            fg=FOREGROUND,
+            bd=0,
+            highlightthickness=0,
+            state="disabled",
+        )
+        infoText.grid(row=1, column=0, sticky="w", pady=2)
+        self._info_text = infoText
 
-        row = i + 1
-        addrs = currentNetworkInfo.get("assignedAddresses")
-        if addrs:
-            l = tk.Label(contentFrame, text="Assigned Addresses:", font="Monospace", bg=BACKGROUND, fg=FOREGROUND)
-            l.grid(row=row, column=0, sticky="ne", padx=(0,5), pady=2)
-            addrFrame = tk.Frame(contentFrame, bg=BACKGROUND)
-            addrFrame.grid(row=row, column=1, sticky="w", pady=2)
-            for j, addr in enumerate(addrs):
-                addrLabel = tk.Label(addrFrame, text=addr, font="Monospace", bg=BACKGROUND, fg=FOREGROUND)
-                addrLabel.grid(row=j, column=0, sticky="w")
-            row += 1
-        else:
-            l = tk.Label(contentFrame, text="Assigned Addresses:", font="Monospace", bg=BACKGROUND, fg=FOREGROUND)
-            v = tk.Label(contentFrame, text="-", font="Monospace", bg=BACKGROUND, fg=FOREGROUND)
-            l.grid(row=row, column=0, sticky="e", padx=(0,5), pady=2)
-            v.grid(row=row, column=1, sticky="w", pady=2)
-            row += 1
-
-        closeButton = self.formatted_buttons(contentFrame, text="Close", bg=BUTTON_BACKGROUND, activebackground=BUTTON_ACTIVE_BACKGROUND, command=infoWindow.destroy)
-        closeButton.grid(row=row, column=0, columnspan=2, pady=(10,0))
-        
-        infoWindow.mainloop()
+        closeButton = self.formatted_buttons(contentFrame, text="Close", command=self._close_info_window)
+        closeButton.grid(row=2, column=0, pady=(10,0))
 
-    # Creates the main application window
+        infoWindow.protocol("WM_DELETE_WINDOW", self._close_info_window)
+        self._info_window = infoWindow
+
+    # Rewrites the info text for the network being shown
+    def _populate_info_window(self, currentNetworkInfo):
+        lines = [
+            _INFO_FMT(lab, "UP" if key is None else currentNetworkInfo.get(key, "N/A"))
+            for lab, key in self._INFO_FIELDS
+        ]
+        addrs = currentNetworkInfo.get("assignedAddresses") or ["-"]
+        lines.append(_INFO_FMT("Assigned Addresses:", addrs[0]))
+        lines.extend(" " * 22 + addr for addr in addrs[1:])
+
+        infoText = self._info_text
+        infoText.configure(state="normal", height=len(lines))
+        infoText.delete("1.0", tk.END)
+        infoText.insert("1.0", "\n".join(lines))
+        infoText.configure(state="disabled")
+
+    # Hides the reusable info window instead of destroying it
+    def _close_info_window(self):
+        self._info_window.grab_release()
+        self._info_window.withdraw()
+
+    # Creates the main application window; guards against a second Tk
+    # root (and Tcl interpreter) ever being spawned
     def create_window(self):
-        return tk.Tk(className="zerotier-gui")
+        if getattr(self, "_root", None) is not None:
+            raise RuntimeError("Tk root already created")
+        self._root = tk.Tk(className="zerotier-gui")
+        return self._root
 
-    # Handles application exit
+    # Handles application exit; destroying the root lets mainloop
+    # return naturally instead of raising SystemExit through Tcl
     def on_exit(self):
+        self._pool.shutdown(wait=False, cancel_futures=True)
+        self.save_network_history()
         self.window.destroy()
-        sys.exit(0)
 
-    # Handles network list click events
-    def on_network_click(self, event):
-        item = self.networkList.identify_row(event.y)
-        if item == "":
-            self.networkList.selection_remove(self.networkList.selection())
-        return
+    # Deselects when a click lands on empty space below the rows
+    def _clear_selection_on_empty(self, event):
+        if not self.networkList.identify_row(event.y):
+            self.networkList.selection_set(())
+
+    # Coalesces bursts of selection events (Windows Tk fires several per
+    # click) into a single button update per idle cycle
+    def _queue_main_buttons_update(self, _event=None):
+        if self._pending_update is None:
+            self._pending_update = self.window.after_idle(self._flush_main_buttons)
 
-    # Updates the state of main buttons based on network selection
+    def _flush_main_buttons(self):
+        self._pending_update = None
+        self.update_main_buttons()
+
+    # Updates the state of main buttons based on network selection;
+    # skips the Tcl configure calls when the state hasn't changed
     def update_main_buttons(self):
-        if self.networkList.selection():
-            self.infoButton["state"] = "normal"
-            self.toggleConnectionButton["state"] = "normal"   # Enabled when a network is selected
-        else:
-            self.infoButton["state"] = "disabled"
-            self.toggleConnectionButton["state"] = "disabled" # Disabled otherwise
+        new_state = "normal" if self.networkList.selection() else "disabled"
+        if new_state == self._main_buttons_state:
+            return
+        self._main_buttons_state = new_state
+        self.infoButton["state"] = new_state
+        self.toggleConnectionButton["state"] = new_state
 
 
 if __name__ == '__main__':